@@ -29,11 +29,14 @@ def main():
 
     # List scripts if requested
     if args.list:
-        print("Available scripts:")
+        # Build the listing and write it in one call
+        buf = ["Available scripts:\n"]
+        append = buf.append
         for name in coordinator.list_scripts():
             info = coordinator.get_script_info(name)
-            print(f"  {name}: {info.description}")
-            print(f"    Supports: {', '.join(sorted(info.supported_flags))}")
+            append(f"  {name}: {info.description}\n")
+            append(f"    Supports: {info.supported_flags_str}\n")
+        sys.stdout.write("".join(buf))
         return
 
     # Determine which scripts to run
@@ -2,6 +2,8 @@
 Example script A - processes fonts.
 """
 
+import sys
+
 from cliparse import BaseParser, register_script
 
 
@@ -23,12 +25,12 @@ def main(args):
         print(f"[Script A] Processing {len(args.files)} fonts")
         if args.format:
             print(f"[Script A] Format filter: {args.format}")
+        # Emit per-file lines in a single write
+        lines = [f"[Script A]   Processing: {file}" for file in args.files]
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    for file in args.files:
-        if args.verbose:
-            print(f"[Script A]   Processing: {file}")
-
-        if not args.dry_run:
+    if not args.dry_run:
+        for file in args.files:
             # Do actual work
             pass
 
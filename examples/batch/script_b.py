@@ -2,6 +2,8 @@
 Example script B - validates fonts.
 """
 
+import sys
+
 from cliparse import BaseParser, register_script
 
 
@@ -25,11 +27,11 @@ def main(args):
         print(f"[Script B] Validating {len(args.files)} fonts")
         if args.strict:
             print("[Script B] Strict mode enabled")
+        # Emit per-file lines in a single write
+        lines = [f"[Script B]   Validating: {file}" for file in args.files]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     for file in args.files:
-        if args.verbose:
-            print(f"[Script B]   Validating: {file}")
-
         # Do validation
         pass
 
@@ -2,6 +2,8 @@
 Simple example of using BaseParser.
 """
 
+import sys
+
 from cliparse import BaseParser
 
 
@@ -25,13 +27,13 @@ def main():
         print(f"Format: {args.format}")
         print(f"Recursive: {args.recursive}")
         print(f"Dry run: {args.dry_run}")
+        # Emit per-file lines in a single write
+        lines = [f"  Processing: {file}" for file in args.files]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Process files
-    for file in args.files:
-        if args.verbose:
-            print(f"  Processing: {file}")
-
-        if not args.dry_run:
+    if not args.dry_run:
+        for file in args.files:
             # Do actual work here
             pass
 
@@ -16,44 +16,48 @@ Provides:
 - Logging: Generic logging setup
 """
 
-from .parser import BaseParser, create_parser
-from .registry import (
-    register_script,
-    Coordinator,
-    ScriptRegistry,
-    ScriptMetadata,
-    ExecutionResult,
-    BatchResults,
-)
-from .formatting import (
-    RICH_AVAILABLE,
-    get_console,
-    emit,
-    success,
-    error,
-    warning,
-    info,
-    status_message,
-    print_success,
-    print_error,
-    print_warning,
-    print_info,
-)
-from .errors import (
-    CliparseError,
-    ValidationError,
-    ParseError,
-    ConfigurationError,
-    ExitCode,
-    format_error,
-)
-from .logging import (
-    Verbosity,
-    VERBOSITY_TO_LEVEL,
-    setup_logger,
-    setup_logger_from_verbosity,
-    get_logger,
-)
+import importlib
+
+# Public names mapped to the submodule that defines them. Submodules are
+# imported on first attribute access (PEP 562) to keep `import cliparse` cheap.
+_LAZY = {
+    # Parser
+    "BaseParser": "parser",
+    "create_parser": "parser",
+    # Registry
+    "register_script": "registry",
+    "Coordinator": "registry",
+    "ScriptRegistry": "registry",
+    "ScriptMetadata": "registry",
+    "ExecutionResult": "registry",
+    "BatchResults": "registry",
+    # Formatting
+    "RICH_AVAILABLE": "formatting",
+    "get_console": "formatting",
+    "emit": "formatting",
+    "success": "formatting",
+    "error": "formatting",
+    "warning": "formatting",
+    "info": "formatting",
+    "status_message": "formatting",
+    "print_success": "formatting",
+    "print_error": "formatting",
+    "print_warning": "formatting",
+    "print_info": "formatting",
+    # Errors
+    "CliparseError": "errors",
+    "ValidationError": "errors",
+    "ParseError": "errors",
+    "ConfigurationError": "errors",
+    "ExitCode": "errors",
+    "format_error": "errors",
+    # Logging
+    "Verbosity": "logging",
+    "VERBOSITY_TO_LEVEL": "logging",
+    "setup_logger": "logging",
+    "setup_logger_from_verbosity": "logging",
+    "get_logger": "logging",
+}
 
 __version__ = "0.1.0"
 
@@ -96,3 +100,16 @@ __all__ = [
     "setup_logger_from_verbosity",
     "get_logger",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        module = importlib.import_module("." + _LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
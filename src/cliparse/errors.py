@@ -5,9 +5,6 @@ Provides structured error handling with exit codes and error formatting.
 Font-agnostic and reusable across CLI projects.
 """
 
-import sys
-import traceback
-
 
 # Exit code constants (following Unix conventions)
 class ExitCode:
@@ -21,6 +18,8 @@ class ExitCode:
 class CliparseError(Exception):
     """Base exception for cliparse errors."""
 
+    __slots__ = ("message", "exit_code", "show_traceback")
+
     def __init__(
         self,
         message: str,
@@ -40,6 +39,12 @@ class CliparseError(Exception):
         self.exit_code = exit_code
         self.show_traceback = show_traceback
 
+    def __reduce__(self):
+        # BaseException pickles args and __dict__ only, which misses slots
+        state = {name: getattr(self, name) for name in CliparseError.__slots__}
+        state.update(self.__dict__)
+        return (type(self), self.args, state)
+
     def exit(self) -> None:
         """
         Exit with appropriate code and optional traceback.
@@ -47,13 +52,17 @@ class CliparseError(Exception):
         This is a convenience method for handling errors in CLI scripts.
         """
         if self.show_traceback:
+            import traceback
+
             traceback.print_exc()
-        sys.exit(self.exit_code)
+        raise SystemExit(self.exit_code)
 
 
 class ValidationError(CliparseError):
     """Validation failed (e.g., invalid input, constraint violation)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, show_traceback: bool = False):
         super().__init__(
             message, exit_code=ExitCode.ERROR, show_traceback=show_traceback
@@ -63,6 +72,8 @@ class ValidationError(CliparseError):
 class ParseError(CliparseError):
     """Argument parsing failed (e.g., invalid flag, missing required arg)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, show_traceback: bool = False):
         super().__init__(
             message, exit_code=ExitCode.USAGE_ERROR, show_traceback=show_traceback
@@ -72,6 +83,8 @@ class ParseError(CliparseError):
 class ConfigurationError(CliparseError):
     """Configuration error (e.g., invalid settings, missing config)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, show_traceback: bool = False):
         super().__init__(
             message, exit_code=ExitCode.ERROR, show_traceback=show_traceback
@@ -91,10 +104,20 @@ def format_error(exception: Exception, include_traceback: bool = False) -> str:
     """
     message = str(exception)
     if include_traceback:
-        tb = "".join(
-            traceback.format_exception(
-                type(exception), exception, exception.__traceback__
-            )
-        )
+        # Formatting walks the traceback and reads source lines, so cache
+        # the result on the exception for repeated formatting. The traceback
+        # grows as the exception propagates, so the cache is keyed on it.
+        cached = getattr(exception, "_cliparse_tb_cache", None)
+        if cached is not None and cached[0] is exception.__traceback__:
+            tb = cached[1]
+        else:
+            import traceback
+
+            te = traceback.TracebackException.from_exception(exception)
+            tb = "".join(te.format())
+            try:
+                exception._cliparse_tb_cache = (exception.__traceback__, tb)
+            except AttributeError:
+                pass
         return f"{message}\n\n{tb}"
     return message
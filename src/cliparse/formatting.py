@@ -5,44 +5,67 @@ Provides Rich-aware formatting with graceful fallback to plain text.
 Font-agnostic and reusable across CLI projects.
 """
 
-import importlib.util
 import re
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-# Check for Rich availability
-RICH_AVAILABLE: bool = importlib.util.find_spec("rich") is not None
 
-if RICH_AVAILABLE:
-    from rich.console import Console
-    from rich.theme import Theme
-
-    # Simple theme for generic CLI use
-    _THEME = Theme(
-        {
-            "success": "success",
-            "error": "red",
-            "warning": "yellow",
-            "info": "blue",
-            "dim": "dim",
-        }
-    )
-
-    # Module-level console singleton
-    _console: Optional[Console] = None
-
-    def get_console() -> Console:
-        """Get or create Rich console instance."""
-        global _console
-        if _console is None:
-            _console = Console(theme=_THEME)
-        return _console
-else:
-    _console = None
-
-    def get_console() -> None:
-        """Rich not available."""
-        return None
+# Rich markup tags, stripped when falling back to plain text
+_MARKUP_RE = re.compile(r"\[/?[^\]]+\]")
+
+# Rich is probed on first use rather than at import time; see _probe_rich()
+_rich_state = None  # (available, Console, Theme) once probed
+_THEME = None
+
+# Probe result cached for the formatters: None until probed, then a bool
+_use_rich: Optional[bool] = None
+
+# Module-level console singleton
+_console: Optional["Console"] = None
+
+
+def _probe_rich() -> bool:
+    """Check for Rich availability, importing it on first call only."""
+    global _rich_state, _THEME, _use_rich
+    if _rich_state is None:
+        # Importing directly is cheaper than a find_spec() probe, which
+        # needs importlib.util and repeats the path search the import does
+        try:
+            from rich.console import Console
+            from rich.theme import Theme
+        except ImportError:
+            _rich_state = (False, None, None)
+        else:
+            # Simple theme for generic CLI use
+            _THEME = Theme(
+                {
+                    "success": "green",
+                    "error": "red",
+                    "warning": "yellow",
+                    "info": "blue",
+                    "dim": "dim",
+                }
+            )
+            _rich_state = (True, Console, Theme)
+        _use_rich = _rich_state[0]
+    return _rich_state[0]
+
+
+def __getattr__(name: str):
+    # RICH_AVAILABLE is resolved lazily so importing this module stays cheap
+    if name == "RICH_AVAILABLE":
+        return _probe_rich()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_console() -> Optional["Console"]:
+    """Get or create Rich console instance (None if Rich is not available)."""
+    global _console
+    if _console is None and _probe_rich():
+        _console = _rich_state[1](theme=_THEME)
+    return _console
 
 
 def emit(message: str, end: str = "\n") -> None:
@@ -53,14 +76,57 @@ def emit(message: str, end: str = "\n") -> None:
         message: Message to emit (may contain Rich markup)
         end: End character (default: newline)
     """
-    if RICH_AVAILABLE and _console:
+    if _probe_rich() and _console:
         get_console().print(message, end=end)
+    elif "[" not in message:
+        # No markup to strip
+        print(message, end=end)
     else:
         # Strip Rich markup for plain text
-        clean_message = re.sub(r"\[/?[^\]]+\]", "", message)
+        clean_message = _MARKUP_RE.sub("", message)
         print(clean_message, end=end)
 
 
+# Styles for canonical status labels
+_LABEL_STYLES = {
+    "ERROR": "error",
+    "FAIL": "error",
+    "FAILED": "error",
+    "WARN": "warning",
+    "WARNING": "warning",
+    "SUCCESS": "success",
+    "OK": "success",
+    "INFO": "info",
+    "DEBUG": "info",
+}
+
+# Label keywords mapped to styles, checked in order for other labels
+_LABEL_KEYWORDS = {
+    "error": "error",
+    "fail": "error",
+    "warn": "warning",
+    "success": "success",
+    "ok": "success",
+}
+
+
+def _label_style(label: str) -> str:
+    """Pick the theme style for a status label."""
+    style = _LABEL_STYLES.get(label) or _LABEL_STYLES.get(label.upper())
+    if style is None:
+        label_lower = label.lower()
+        style = "info"
+        for keyword, keyword_style in _LABEL_KEYWORDS.items():
+            if keyword in label_lower:
+                style = keyword_style
+                break
+    return style
+
+
+# The formatters test the cached _use_rich flag and only call _probe_rich()
+# until Rich has been probed once.
+
+
 def success(message: str) -> str:
     """
     Format success message.
@@ -71,7 +137,7 @@ def success(message: str) -> str:
     Returns:
         Formatted message (Rich markup if available)
     """
-    if RICH_AVAILABLE:
+    if _use_rich or (_use_rich is None and _probe_rich()):
         return f"[success]✓[/success] {message}"
     return f"✓ {message}"
 
@@ -86,7 +152,7 @@ def error(message: str) -> str:
     Returns:
         Formatted message (Rich markup if available)
     """
-    if RICH_AVAILABLE:
+    if _use_rich or (_use_rich is None and _probe_rich()):
         return f"[error]✗[/error] {message}"
     return f"✗ {message}"
 
@@ -101,7 +167,7 @@ def warning(message: str) -> str:
     Returns:
         Formatted message (Rich markup if available)
     """
-    if RICH_AVAILABLE:
+    if _use_rich or (_use_rich is None and _probe_rich()):
         return f"[warning]⚠[/warning] {message}"
     return f"⚠ {message}"
 
@@ -116,7 +182,7 @@ def info(message: str) -> str:
     Returns:
         Formatted message (Rich markup if available)
     """
-    if RICH_AVAILABLE:
+    if _use_rich or (_use_rich is None and _probe_rich()):
         return f"[info]ℹ[/info] {message}"
     return f"ℹ {message}"
 
@@ -132,18 +198,9 @@ def status_message(label: str, message: str) -> str:
     Returns:
         Formatted message
     """
-    if RICH_AVAILABLE:
+    if _use_rich or (_use_rich is None and _probe_rich()):
         # Use appropriate color based on label
-        label_lower = label.lower()
-        if "error" in label_lower or "fail" in label_lower:
-            style = "error"
-        elif "warn" in label_lower:
-            style = "warning"
-        elif "success" in label_lower or "ok" in label_lower:
-            style = "success"
-        else:
-            style = "info"
-
+        style = _label_style(label)
         return f"[{style}]{label}[/{style}] {message}"
     return f"{label} {message}"
 
@@ -6,7 +6,9 @@ Font-agnostic and reusable across CLI projects.
 """
 
 import logging
+import sys
 from enum import IntEnum
+from types import MappingProxyType
 from typing import Optional
 
 
@@ -19,13 +21,30 @@ class Verbosity(IntEnum):
     DEBUG = 3  # Internal execution steps, developer-focused
 
 
-# Map verbosity to logging levels
-VERBOSITY_TO_LEVEL = {
-    Verbosity.QUIET: logging.ERROR,
-    Verbosity.BRIEF: logging.INFO,
-    Verbosity.VERBOSE: logging.INFO,
-    Verbosity.DEBUG: logging.DEBUG,
-}
+# Logging level for each verbosity, indexed by Verbosity value
+_VERBOSITY_LEVELS = (
+    logging.ERROR,  # QUIET
+    logging.INFO,  # BRIEF
+    logging.INFO,  # VERBOSE
+    logging.DEBUG,  # DEBUG
+)
+
+# Map verbosity to logging levels (read-only view for backward compatibility)
+VERBOSITY_TO_LEVEL = MappingProxyType(dict(enumerate(_VERBOSITY_LEVELS)))
+
+# Simple formatter - just the message
+_SHARED_FORMATTER = logging.Formatter("%(message)s")
+
+
+class _StderrHandler(logging.StreamHandler):
+    """StreamHandler that writes to whatever sys.stderr is at emit time."""
+
+    def __init__(self, level: int = logging.NOTSET):
+        logging.Handler.__init__(self, level)
+
+    @property
+    def stream(self):
+        return sys.stderr
 
 
 def setup_logger(
@@ -60,19 +79,29 @@ def setup_logger(
     else:
         log_level = logging.INFO
 
+    # Repeat setups only touch the levels, and only when they change
+    # (setLevel clears the level cache of every logger). A logger whose
+    # handlers were removed since is set up again.
+    if getattr(logger, "_cliparse_configured", False) and logger.handlers:
+        if logger.level != log_level:
+            logger.setLevel(log_level)
+            handler = logger._cliparse_handler
+            if handler is not None:
+                handler.setLevel(log_level)
+        return logger
+
     logger.setLevel(log_level)
 
-    # Only add handler if one doesn't exist
+    # Only add handler if one doesn't exist. The handler level also filters
+    # records propagated from child loggers with a lower level.
+    handler = None
     if not logger.handlers:
-        handler = logging.StreamHandler()
-        handler.setLevel(log_level)
-
-        # Simple formatter - just the message
-        formatter = logging.Formatter("%(message)s")
-        handler.setFormatter(formatter)
-
+        handler = _StderrHandler(log_level)
+        handler.setFormatter(_SHARED_FORMATTER)
         logger.addHandler(handler)
 
+    logger._cliparse_handler = handler
+    logger._cliparse_configured = True
     return logger
 
 
@@ -89,7 +118,10 @@ def setup_logger_from_verbosity(
     Returns:
         Configured logger
     """
-    level = VERBOSITY_TO_LEVEL.get(verbosity, logging.INFO)
+    if isinstance(verbosity, int) and 0 <= verbosity < len(_VERBOSITY_LEVELS):
+        level = _VERBOSITY_LEVELS[verbosity]
+    else:
+        level = logging.INFO
     return setup_logger(name, level=level)
 
 
@@ -3,9 +3,65 @@ BaseParser - Argparse with standard flags built-in.
 """
 
 import argparse
+import operator
 import sys
 from typing import Optional, List
 
+# argparse (before the upstream fix) finds the next option string by scanning
+# every option index for each option consumed, which is quadratic in the
+# number of option strings. The replacement walks forward from start_index.
+_QUADRATIC_SCAN = """\
+            next_option_string_index = min([
+                index
+                for index in option_string_indices
+                if index >= start_index])
+"""
+_LINEAR_SCAN = """\
+            next_option_string_index = start_index
+            while next_option_string_index <= max_option_string_index:
+                if next_option_string_index in option_string_indices:
+                    break
+                next_option_string_index += 1
+"""
+
+# Only argv at least this long uses the patched parse loop
+_LINEAR_SCAN_MIN_ARGS = 256
+
+# Flag actions _fast_parse applies itself (subclasses may override __call__)
+_FAST_FLAG_ACTIONS = (
+    argparse._StoreConstAction,
+    argparse._StoreTrueAction,
+    argparse._StoreFalseAction,
+)
+
+# Patched copy of ArgumentParser._parse_known_args; False if unavailable
+_linear_parse_known_args = None
+
+
+def _get_linear_parse_known_args():
+    """
+    Build argparse's _parse_known_args with the linear option scan.
+
+    Returns None if the argparse source is unavailable or already fixed.
+    """
+    global _linear_parse_known_args
+    if _linear_parse_known_args is None:
+        _linear_parse_known_args = False
+        import inspect
+        import textwrap
+
+        try:
+            source = inspect.getsource(argparse.ArgumentParser._parse_known_args)
+        except (OSError, TypeError):
+            return None
+        if _QUADRATIC_SCAN in source:
+            source = textwrap.dedent(source.replace(_QUADRATIC_SCAN, _LINEAR_SCAN))
+            namespace = {}
+            code = compile(source, "<cliparse argparse backport>", "exec")
+            exec(code, vars(argparse), namespace)
+            _linear_parse_known_args = namespace["_parse_known_args"]
+    return _linear_parse_known_args or None
+
 
 class BaseParser(argparse.ArgumentParser):
     """
@@ -36,22 +92,22 @@ class BaseParser(argparse.ArgumentParser):
     # Standard flag definitions
     STANDARD_FLAGS = {
         "recursive": {
-            "flags": ["-R", "--recursive"],
+            "flags": ("-R", "--recursive"),
             "action": "store_true",
             "help": "Process directories recursively",
         },
         "dry-run": {
-            "flags": ["-n", "--dry-run"],
+            "flags": ("-n", "--dry-run"),
             "action": "store_true",
             "help": "Show what would be done without making changes",
         },
         "yes": {
-            "flags": ["-y", "--yes"],
+            "flags": ("-y", "--yes"),
             "action": "store_true",
             "help": "Automatically answer yes to all prompts",
         },
         "verbose": {
-            "flags": ["-v", "--verbose"],
+            "flags": ("-v", "--verbose"),
             "action": "store_true",
             "help": "Enable verbose output",
         },
@@ -67,7 +123,7 @@ class BaseParser(argparse.ArgumentParser):
         # Determine which standard flags to include
         if standard_flags is None:
             # Include all by default
-            standard_flags = list(self.STANDARD_FLAGS.keys())
+            standard_flags = list(self.STANDARD_FLAGS)
 
         # Initialize parent ArgumentParser
         super().__init__(description=description, epilog=epilog, **kwargs)
@@ -78,35 +134,213 @@ class BaseParser(argparse.ArgumentParser):
         # Store which standard flags were added
         self._standard_flags = standard_flags
 
+    @classmethod
+    def _standard_flag_specs(cls) -> dict:
+        """
+        Return (option strings, add_argument kwargs) for each standard flag.
+
+        Built from the class's own STANDARD_FLAGS on first use and cached
+        per class, so subclasses that override STANDARD_FLAGS get theirs.
+        """
+        cached = cls.__dict__.get("_standard_flag_specs_cache")
+        if cached is None or cached[0] is not cls.STANDARD_FLAGS:
+            specs = {
+                name: (
+                    flag_def["flags"],
+                    {"action": flag_def["action"], "help": flag_def["help"]},
+                )
+                for name, flag_def in cls.STANDARD_FLAGS.items()
+            }
+            cached = (cls.STANDARD_FLAGS, specs)
+            cls._standard_flag_specs_cache = cached
+        return cached[1]
+
     def _add_standard_flags(self, flags: List[str]) -> None:
         """Add standard flags to the parser."""
+        specs = self._standard_flag_specs()
         for flag_name in flags:
-            if flag_name not in self.STANDARD_FLAGS:
+            if flag_name not in specs:
                 raise ValueError(
                     f"Unknown standard flag: {flag_name}. "
                     f"Available: {list(self.STANDARD_FLAGS.keys())}"
                 )
 
-            flag_def = self.STANDARD_FLAGS[flag_name]
-            self.add_argument(
-                *flag_def["flags"], action=flag_def["action"], help=flag_def["help"]
-            )
+            option_strings, kwargs = specs[flag_name]
+            self.add_argument(*option_strings, **kwargs)
 
     def get_standard_flags(self) -> List[str]:
         """Return list of standard flags included in this parser."""
         return self._standard_flags.copy()
 
     def parse_args(self, args=None, namespace=None):
+        if namespace is None:
+            args = sys.argv[1:] if args is None else list(args)
+            if not args:
+                return self._parse_empty()
+            if self._has_default_parse_hooks():
+                parsed = self._fast_parse(args)
+                if parsed is not None:
+                    return parsed
+        return super().parse_args(args, namespace)
+
+    def _has_default_parse_hooks(self) -> bool:
+        """Whether parse_known_args/_parse_known_args are BaseParser's own."""
+        cls = type(self)
+        return (
+            cls.parse_known_args is BaseParser.parse_known_args
+            and cls._parse_known_args is BaseParser._parse_known_args
+        )
+
+    def _parse_empty(self) -> argparse.Namespace:
         """
-        Parse arguments with enhanced error handling.
+        Parse an empty argv, reusing a cached all-defaults namespace.
 
-        Exits with code 2 on error (standard argparse behavior).
+        The namespace is parsed once by argparse (so required arguments
+        still error) and copied on later calls until any action, default or
+        mutually exclusive group changes. Parsers whose empty parse must run
+        every time (string defaults converted by type=, or overridden parse
+        hooks) are not cached.
         """
-        try:
-            return super().parse_args(args, namespace)
-        except SystemExit as e:
-            # Re-raise with same exit code
-            sys.exit(e.code)
+        key = self._empty_parse_key() if self._has_default_parse_hooks() else None
+        if key is None:
+            return super().parse_args([])
+        cached_key = getattr(self, "_default_namespace_key", None)
+        if (
+            cached_key is None
+            or len(cached_key) != len(key)
+            or not all(map(operator.is_, cached_key, key))
+        ):
+            self._default_namespace = super().parse_args([])
+            self._default_namespace_key = key
+        return argparse.Namespace(**vars(self._default_namespace))
+
+    def _empty_parse_key(self) -> Optional[tuple]:
+        """
+        Everything an empty-argv parse depends on, compared by identity.
+
+        Returns None if the parse can't be cached: argparse converts string
+        defaults with type= on every parse (e.g. FileType opens a new file).
+        """
+        key = []
+        for group in self._mutually_exclusive_groups:
+            key += (group, group.required)
+        for action in self._actions:
+            if action.type is not None and isinstance(action.default, str):
+                return None
+            key += (action, action.default, action.required)
+        # Shared with argument groups, whose set_defaults() bypasses ours
+        for item in self._defaults.items():
+            key += item
+        return tuple(key)
+
+    def _get_fast_spec(self):
+        """
+        Describe this parser for _fast_parse, or return None if unsupported.
+
+        Supported parsers have only flag options (store_true/store_false/
+        store_const, plus help/version) and at most one plain nargs='+'
+        positional. The result is cached until the actions change.
+        """
+        key = (tuple(self._actions), len(self._mutually_exclusive_groups))
+        if getattr(self, "_fast_spec_key", None) == key:
+            return self._fast_spec
+
+        spec = None
+        if (
+            not self._mutually_exclusive_groups
+            and self.prefix_chars == "-"
+            and self.fromfile_prefix_chars is None
+        ):
+            options = {}
+            positionals = []
+            supported = True
+            for action in self._actions:
+                if action.option_strings:
+                    if type(action) in _FAST_FLAG_ACTIONS:
+                        if action.required:
+                            supported = False
+                            break
+                        for option_string in action.option_strings:
+                            options[option_string] = action
+                    elif not isinstance(
+                        action, (argparse._HelpAction, argparse._VersionAction)
+                    ):
+                        supported = False
+                        break
+                elif (
+                    type(action) is argparse._StoreAction
+                    and action.nargs == argparse.ONE_OR_MORE
+                    and action.type is None
+                    and action.choices is None
+                ):
+                    positionals.append(action)
+                else:
+                    supported = False
+                    break
+            if supported and len(positionals) <= 1:
+                spec = (options, positionals[0] if positionals else None)
+
+        self._fast_spec = spec
+        self._fast_spec_key = key
+        return spec
+
+    def _fast_parse(self, args: List[str]) -> Optional[argparse.Namespace]:
+        """
+        Parse simple flag/positional argv without argparse's state machine.
+
+        Returns None whenever the parser or argv falls outside the simple
+        case (unknown or abbreviated options, --help, '--', errors), so the
+        caller can defer to argparse for identical results and messages.
+        """
+        spec = self._get_fast_spec()
+        if spec is None:
+            return None
+        options, positional = spec
+
+        # As in argparse, the first action with a given dest sets its default
+        namespace = argparse.Namespace()
+        for action in self._actions:
+            if action.dest is not argparse.SUPPRESS:
+                if not hasattr(namespace, action.dest):
+                    if action.default is not argparse.SUPPRESS:
+                        setattr(namespace, action.dest, action.default)
+        for dest, value in self._defaults.items():
+            if not hasattr(namespace, dest):
+                setattr(namespace, dest, value)
+
+        # argparse only accepts a single contiguous run of positionals
+        values = []
+        run_ended = False
+        for arg in args:
+            action = options.get(arg)
+            if action is not None:
+                setattr(namespace, action.dest, action.const)
+                if values:
+                    run_ended = True
+            elif arg[:1] == "-" and arg != "-":
+                return None
+            elif run_ended:
+                return None
+            else:
+                values.append(arg)
+
+        if positional is None:
+            if values:
+                return None
+        elif not values:
+            return None
+        else:
+            setattr(namespace, positional.dest, values)
+        return namespace
+
+    def _parse_known_args(self, arg_strings, *args, **kwargs):
+        # Large argv lists (e.g. forwarded by a batch runner) use a copy of
+        # argparse's parse loop without the quadratic option scan
+        if len(arg_strings) >= _LINEAR_SCAN_MIN_ARGS:
+            parse_known_args = _get_linear_parse_known_args()
+            if parse_known_args is not None:
+                return parse_known_args(self, arg_strings, *args, **kwargs)
+        return super()._parse_known_args(arg_strings, *args, **kwargs)
 
 
 # Convenience function for quick parser creation
@@ -3,21 +3,38 @@ Script registry and coordination system for multi-script projects.
 """
 
 import sys
-import importlib
-from typing import Dict, List, Optional, Callable, Any, Set
+import threading
+import weakref
+from typing import Dict, List, Optional, Callable, FrozenSet, Iterable, Tuple
 from dataclasses import dataclass, field
-from pathlib import Path
 
+from .errors import ParseError
 
-@dataclass
+# Flag prefix, compared against an argument's first character
+_DASH = "-"
+
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ScriptMetadata:
     """Metadata for a registered script."""
 
     name: str
     description: str
     parser_factory: Callable
-    supported_flags: Set[str]
+    supported_flags: FrozenSet[str]
     module_path: Optional[str] = None
+    # Derived at registration for listings
+    supported_flags_sorted: Tuple[str, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    supported_flags_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.supported_flags_sorted = tuple(sorted(self.supported_flags))
+        self.supported_flags_str = ", ".join(self.supported_flags_sorted)
 
     def supports_flag(self, flag: str) -> bool:
         """Check if this script supports a given flag."""
@@ -28,24 +45,19 @@ class ScriptRegistry:
     """
     Central registry for scripts with metadata.
 
-    Singleton pattern - all registrations go to the same registry.
+    All state and methods are class-level, so every registration goes to
+    the same registry; the class itself can be used without instantiating.
     """
 
-    _instance = None
     _scripts: Dict[str, ScriptMetadata] = {}
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     @classmethod
     def register(
         cls,
         name: str,
         description: str,
         parser_factory: Callable,
-        supported_flags: List[str],
+        supported_flags: Iterable[str],
     ) -> None:
         """
         Register a script with metadata.
@@ -54,13 +66,14 @@ class ScriptRegistry:
             name: Unique script identifier
             description: Script description
             parser_factory: Function that returns configured parser
-            supported_flags: List of flags this script accepts
+            supported_flags: Flags this script accepts
         """
         metadata = ScriptMetadata(
             name=name,
             description=description,
             parser_factory=parser_factory,
-            supported_flags=set(supported_flags),
+            # Interned so membership tests can match argv strings by identity
+            supported_flags=frozenset(sys.intern(flag) for flag in supported_flags),
         )
         cls._scripts[name] = metadata
 
@@ -93,7 +106,8 @@ def register_script(
 
     Args:
         name: Unique script identifier
-        description: Script description (defaults to parser description)
+        description: Script description (defaults to the first line of the
+            factory's docstring, then to the parser's description)
         supports: List of flags this script supports (e.g., ['-R', '--dry-run'])
 
     Example:
@@ -109,8 +123,13 @@ def register_script(
     """
 
     def decorator(parser_factory: Callable):
-        # Get description from parser if not provided
+        # Prefer the factory docstring over building a parser at import
+        # time just to read its description
         desc = description
+        if desc is None:
+            doc = (parser_factory.__doc__ or "").strip()
+            if doc:
+                desc = doc.splitlines()[0]
         if desc is None:
             parser = parser_factory()
             desc = parser.description or name
@@ -120,7 +139,7 @@ def register_script(
             name=name,
             description=desc,
             parser_factory=parser_factory,
-            supported_flags=supports or [],
+            supported_flags=supports or (),
         )
 
         return parser_factory
@@ -128,7 +147,7 @@ def register_script(
     return decorator
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExecutionResult:
     """Result from executing a script."""
 
@@ -138,12 +157,16 @@ class ExecutionResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchResults:
     """Aggregated results from batch execution."""
 
     results: List[ExecutionResult] = field(default_factory=list)
 
+    def add(self, result: ExecutionResult) -> None:
+        """Add a script result."""
+        self.results.append(result)
+
     @property
     def all_success(self) -> bool:
         """Check if all scripts succeeded."""
@@ -157,33 +180,64 @@ class BatchResults:
     @property
     def success_count(self) -> int:
         """Count of successful scripts."""
-        return sum(1 for r in self.results if r.success)
+        return len(self.results) - self.failed_count
 
     def summary(self) -> str:
         """Generate a summary string."""
+        # Single pass: everything else is derived from the failures
+        failed = [r for r in self.results if not r.success]
         total = len(self.results)
-        success = self.success_count
-        failed = self.failed_count
 
-        lines = [f"Executed {total} script(s):"]
-        lines.append(f"  ✓ Success: {success}")
+        lines = [
+            f"Executed {total} script(s):",
+            f"  ✓ Success: {total - len(failed)}",
+        ]
 
-        if failed > 0:
-            lines.append(f"  ✗ Failed: {failed}")
-            for result in self.results:
-                if not result.success:
-                    lines.append(f"    - {result.script_name}: {result.error_message}")
+        if failed:
+            lines.append(f"  ✗ Failed: {len(failed)}")
+            lines.extend([f"    - {r.script_name}: {r.error_message}" for r in failed])
 
         return "\n".join(lines)
 
 
+def _raise_parse_error(message: str) -> None:
+    """Replacement for ArgumentParser.error used during batch runs."""
+    raise ParseError(message)
+
+
+def _parse_script_args(parser, script_args: List[str], parse_known: bool) -> None:
+    """Parse a script's args, dropping unknown ones if parse_known is set."""
+    if parse_known:
+        parser.parse_known_args(script_args)
+    else:
+        parser.parse_args(script_args)
+
+
+# Per-parser locks, so a parser shared between scripts run on a thread pool
+# only has its error() overridden by one parse at a time
+_parser_locks: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_parser_locks_guard = threading.Lock()
+
+
+def _parser_lock(parser) -> threading.Lock:
+    """Return the lock guarding error() overrides on this parser."""
+    with _parser_locks_guard:
+        lock = _parser_locks.get(parser)
+        if lock is None:
+            lock = _parser_locks[parser] = threading.Lock()
+    return lock
+
+
 class Coordinator:
     """
     Coordinates execution of multiple scripts with intelligent flag filtering.
     """
 
     def __init__(self):
-        self.registry = ScriptRegistry()
+        self.registry = ScriptRegistry
+        # script name -> (metadata, filtered args) for the most recent args
+        self._filter_cache: Dict[str, Tuple[ScriptMetadata, List[str]]] = {}
+        self._filter_cache_args: Optional[Tuple[str, ...]] = None
 
     def load_scripts(self, module_paths: List[str]) -> None:
         """
@@ -194,6 +248,8 @@ class Coordinator:
         Args:
             module_paths: List of module paths (e.g., ['my_package.script_a'])
         """
+        import importlib
+
         for module_path in module_paths:
             try:
                 importlib.import_module(module_path)
@@ -210,21 +266,59 @@ class Coordinator:
             directory: Directory path to search
             pattern: Glob pattern for script files
         """
-        dir_path = Path(directory)
-
-        for script_file in dir_path.glob(pattern):
-            if script_file.stem.startswith("_"):
-                continue
-
-            # Import the module
-            module_name = script_file.stem
+        import fnmatch
+        import importlib.util
+        import os
+
+        # Match names from a single directory scan (skipping private files
+        # before matching); only patterns spanning subdirectories need glob
+        if "/" in pattern or os.sep in pattern:
+            from pathlib import Path
+
+            script_files = [
+                str(path)
+                for path in Path(directory).glob(pattern)
+                if not path.name.startswith("_")
+            ]
+        else:
             try:
-                # Add directory to path temporarily
-                sys.path.insert(0, str(dir_path))
-                importlib.import_module(module_name)
-                sys.path.pop(0)
-            except Exception as e:
-                print(f"Warning: Could not load {script_file}: {e}", file=sys.stderr)
+                with os.scandir(directory) as entries:
+                    script_files = [
+                        entry.path
+                        for entry in entries
+                        if not entry.name.startswith("_")
+                        and fnmatch.fnmatch(entry.name, pattern)
+                    ]
+            except OSError:
+                script_files = []
+
+        # Keep the directory on sys.path (once, not per file) while scripts
+        # execute, so they can still import sibling modules
+        dir_str = os.fspath(directory)
+        sys.path.insert(0, dir_str)
+        try:
+            for script_file in script_files:
+                # Import the module straight from its file
+                module_name = os.path.splitext(os.path.basename(script_file))[0]
+                if module_name in sys.modules:
+                    continue
+                try:
+                    spec = importlib.util.spec_from_file_location(
+                        module_name, script_file
+                    )
+                    module = importlib.util.module_from_spec(spec)
+                    sys.modules[module_name] = module
+                    try:
+                        spec.loader.exec_module(module)
+                    except BaseException:
+                        del sys.modules[module_name]
+                        raise
+                except Exception as e:
+                    print(
+                        f"Warning: Could not load {script_file}: {e}", file=sys.stderr
+                    )
+        finally:
+            sys.path.remove(dir_str)
 
     def filter_args_for_script(
         self, script_name: str, all_args: List[str]
@@ -245,50 +339,63 @@ class Coordinator:
         if not script:
             raise ValueError(f"Unknown script: {script_name}")
 
+        return self._filter_with_metadata(script, all_args)
+
+    @staticmethod
+    def _filter_with_metadata(script: ScriptMetadata, all_args: List[str]) -> List[str]:
+        """Filter arguments for an already looked-up script."""
+        supported = script.supported_flags
         filtered = []
-        skip_next = False
+        append = filtered.append
+        n = len(all_args)
+        i = 0
 
-        for i, arg in enumerate(all_args):
-            if skip_next:
-                skip_next = False
+        while i < n:
+            arg = all_args[i]
+
+            # Positional argument - always include
+            if arg[:1] != _DASH:
+                append(arg)
+                i += 1
                 continue
 
-            # Check if this is a flag
-            if arg.startswith("-"):
-                # Handle --flag=value format
-                if "=" in arg:
-                    flag = arg.split("=")[0]
-                    if script.supports_flag(flag):
-                        filtered.append(arg)
-                # Handle -flag value format
-                else:
-                    if script.supports_flag(arg):
-                        filtered.append(arg)
-                        # Check if next arg is a value (not a flag)
-                        if i + 1 < len(all_args) and not all_args[i + 1].startswith(
-                            "-"
-                        ):
-                            filtered.append(all_args[i + 1])
-                            skip_next = True
-                    else:
-                        # Flag not supported - skip it and its value if present
-                        if i + 1 < len(all_args) and not all_args[i + 1].startswith(
-                            "-"
-                        ):
-                            skip_next = True
-            else:
-                # Positional argument - always include
-                filtered.append(arg)
+            # Handle --flag=value format
+            if "=" in arg:
+                if arg.partition("=")[0] in supported:
+                    append(arg)
+                i += 1
+                continue
+
+            # Handle -flag value format: the next arg is its value if it
+            # isn't a flag, and is kept or dropped along with the flag
+            has_value = i + 1 < n and all_args[i + 1][:1] != _DASH
+            if arg in supported:
+                append(arg)
+                if has_value:
+                    append(all_args[i + 1])
+            i += 2 if has_value else 1
 
         return filtered
 
-    def run(self, scripts: List[str], args: Optional[List[str]] = None) -> BatchResults:
+    def run(
+        self,
+        scripts: List[str],
+        args: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        use_parse_known: bool = False,
+    ) -> BatchResults:
         """
         Run multiple scripts with filtered arguments.
 
         Args:
             scripts: List of script names to run
             args: Command-line arguments (defaults to sys.argv[1:])
+            max_workers: Run scripts on a thread pool of this size
+                (default: run sequentially). Results keep script order.
+            use_parse_known: Skip flag filtering and let each parser drop
+                unknown arguments via parse_known_args. Faster, but ignores
+                declared supports and may take an unknown flag's value as a
+                positional argument.
 
         Returns:
             BatchResults with execution results
@@ -296,50 +403,148 @@ class Coordinator:
         if args is None:
             args = sys.argv[1:]
 
+        if not args:
+            return self._run_all_empty(scripts)
+
+        # Intern flag-shaped tokens once, so every script's membership test
+        # against its (interned) supported flags can match by identity.
+        # File paths and other values are left alone.
+        intern = sys.intern
+        args = [
+            intern(a) if a[:2] == "--" or (a[:1] == _DASH and len(a) <= 3) else a
+            for a in args
+        ]
+
         results = BatchResults()
+        args_key = tuple(args)
+
+        if max_workers and len(scripts) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for result in executor.map(
+                    lambda name: self._run_single_script(
+                        name, args, args_key, use_parse_known
+                    ),
+                    scripts,
+                ):
+                    results.add(result)
+            return results
 
         for script_name in scripts:
-            result = self._run_single_script(script_name, args)
-            results.results.append(result)
+            result = self._run_single_script(
+                script_name, args, args_key, use_parse_known
+            )
+            results.add(result)
 
         return results
 
+    def _run_all_empty(self, scripts: List[str]) -> BatchResults:
+        """Run scripts with no arguments (nothing to filter)."""
+        results = BatchResults()
+        for script_name in scripts:
+            script = self.registry.get(script_name)
+            if not script:
+                results.add(self._script_not_found(script_name))
+            else:
+                results.add(self._execute_script(script, []))
+        return results
+
     def _run_single_script(
-        self, script_name: str, all_args: List[str]
+        self,
+        script_name: str,
+        all_args: List[str],
+        args_key: Optional[Tuple[str, ...]] = None,
+        use_parse_known: bool = False,
     ) -> ExecutionResult:
         """Run a single script with filtered arguments."""
         script = self.registry.get(script_name)
 
         if not script:
-            return ExecutionResult(
-                script_name=script_name,
-                success=False,
-                exit_code=1,
-                error_message=f"Script not found: {script_name}",
-            )
+            return self._script_not_found(script_name)
+
+        if use_parse_known:
+            return self._execute_script(script, all_args, parse_known=True)
+
+        # Filter arguments for this script (cached for the most recent argv
+        # only, so a long-lived coordinator doesn't accumulate entries)
+        if args_key is None:
+            args_key = tuple(all_args)
+        filter_cache = self._filter_cache
+        if args_key is not self._filter_cache_args:
+            if args_key != self._filter_cache_args:
+                filter_cache = self._filter_cache = {}
+            self._filter_cache_args = args_key
+        cached = filter_cache.get(script_name)
+        if cached is not None and cached[0] is script:
+            filtered_args = cached[1]
+        else:
+            filtered_args = self._filter_with_metadata(script, all_args)
+            filter_cache[script_name] = (script, filtered_args)
+
+        return self._execute_script(script, filtered_args)
+
+    @staticmethod
+    def _script_not_found(script_name: str) -> ExecutionResult:
+        """Result for a script name that isn't registered."""
+        return ExecutionResult(
+            script_name=script_name,
+            success=False,
+            exit_code=1,
+            error_message=f"Script not found: {script_name}",
+        )
 
-        try:
-            # Filter arguments for this script
-            filtered_args = self.filter_args_for_script(script_name, all_args)
+    @staticmethod
+    def _execute_script(
+        script: ScriptMetadata, script_args: List[str], parse_known: bool = False
+    ) -> ExecutionResult:
+        """Create the script's parser and parse its args."""
+        import argparse
 
-            # Create parser and parse arguments
+        try:
+            # Create parser and parse arguments. Parse errors raise ParseError
+            # instead of formatting usage to stderr and exiting.
             parser = script.parser_factory()
-            parsed_args = parser.parse_args(filtered_args)
+            if isinstance(parser, argparse.ArgumentParser):
+                with _parser_lock(parser):
+                    # Factories may hand out a shared parser, possibly with its
+                    # own error() set on the instance; restore it afterwards
+                    instance_attrs = vars(parser)
+                    had_error = "error" in instance_attrs
+                    prev_error = instance_attrs.get("error")
+                    parser.error = _raise_parse_error
+                    try:
+                        _parse_script_args(parser, script_args, parse_known)
+                    finally:
+                        if had_error:
+                            parser.error = prev_error
+                        else:
+                            del parser.error
+            else:
+                # Other parser-like objects are used as they are
+                _parse_script_args(parser, script_args, parse_known)
 
             # Success - script would run with these args
             # (In real usage, you'd call the script's main function here)
-            return ExecutionResult(script_name=script_name, success=True, exit_code=0)
+            return ExecutionResult(script_name=script.name, success=True, exit_code=0)
 
+        except ParseError as e:
+            return ExecutionResult(
+                script_name=script.name,
+                success=False,
+                exit_code=e.exit_code,
+                error_message=f"Argument parsing failed: {e.message}",
+            )
         except SystemExit as e:
             return ExecutionResult(
-                script_name=script_name,
+                script_name=script.name,
                 success=False,
                 exit_code=e.code,
                 error_message="Argument parsing failed",
             )
         except Exception as e:
             return ExecutionResult(
-                script_name=script_name,
+                script_name=script.name,
                 success=False,
                 exit_code=1,
                 error_message=str(e),
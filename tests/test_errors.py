@@ -0,0 +1,43 @@
+"""Tests for cliparse errors."""
+
+import pickle
+
+from cliparse.errors import CliparseError, ExitCode, ParseError, format_error
+
+
+def test_errors_survive_pickling():
+    """Test that exit code and traceback flag survive a pickle round trip."""
+    error = pickle.loads(
+        pickle.dumps(CliparseError("m", exit_code=5, show_traceback=True))
+    )
+    assert (error.message, error.exit_code, error.show_traceback) == ("m", 5, True)
+
+    error = pickle.loads(pickle.dumps(ParseError("bad flag", show_traceback=True)))
+    assert type(error) is ParseError
+    assert error.message == "bad flag"
+    assert error.exit_code == ExitCode.USAGE_ERROR
+    assert error.show_traceback is True
+
+
+def test_format_error_traceback_follows_propagation():
+    """Test that a re-raised exception's traceback isn't served stale."""
+    formatted = []
+
+    def inner():
+        raise ValueError("boom")
+
+    def middle():
+        try:
+            inner()
+        except ValueError as e:
+            formatted.append(format_error(e, include_traceback=True))
+            raise
+
+    try:
+        middle()
+    except ValueError as e:
+        formatted.append(format_error(e, include_traceback=True))
+        assert format_error(e, include_traceback=True) == formatted[1]
+
+    assert "test_format_error_traceback_follows_propagation" not in formatted[0]
+    assert "test_format_error_traceback_follows_propagation" in formatted[1]
@@ -0,0 +1,54 @@
+"""Tests for logging setup."""
+
+import contextlib
+import io
+import logging
+
+from cliparse.logging import Verbosity, setup_logger, setup_logger_from_verbosity
+
+
+def _reset(*names):
+    for name in names:
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.__dict__.pop("_cliparse_configured", None)
+
+
+def test_setup_logger_writes_to_current_stderr():
+    """Test that loggers write to sys.stderr as it is when they emit."""
+    _reset("cliparse-test-a", "cliparse-test-b")
+    first, second = io.StringIO(), io.StringIO()
+
+    with contextlib.redirect_stderr(first):
+        setup_logger("cliparse-test-a").info("a")
+    with contextlib.redirect_stderr(second):
+        setup_logger("cliparse-test-b").info("b")
+
+    assert first.getvalue() == "a\n"
+    assert second.getvalue() == "b\n"
+
+
+def test_setup_logger_child_records_not_duplicated():
+    """Test that a quieter parent doesn't repeat a child's records."""
+    _reset("cliparse-app", "cliparse-app.sub")
+    parent = setup_logger("cliparse-app", level=logging.ERROR)
+    child = setup_logger("cliparse-app.sub", level=logging.DEBUG)
+
+    stream = io.StringIO()
+    with contextlib.redirect_stderr(stream):
+        child.info("once")
+        parent.info("hidden")
+
+    assert stream.getvalue() == "once\n"
+
+
+def test_setup_logger_from_verbosity_falls_back_to_info():
+    """Test that unknown verbosity values log at INFO."""
+    _reset("cliparse-verbosity")
+    logger = setup_logger_from_verbosity("cliparse-verbosity", Verbosity.DEBUG)
+    assert logger.level == logging.DEBUG
+
+    for verbosity in (None, "loud", 7, -1):
+        _reset("cliparse-verbosity")
+        logger = setup_logger_from_verbosity("cliparse-verbosity", verbosity)
+        assert logger.level == logging.INFO
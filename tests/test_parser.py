@@ -1,7 +1,14 @@
 """Tests for BaseParser."""
 
+import inspect
+from unittest import mock
+
 import pytest
-from cliparse.parser import BaseParser
+from cliparse.parser import (
+    _QUADRATIC_SCAN,
+    BaseParser,
+    _get_linear_parse_known_args,
+)
 
 
 def test_base_parser_includes_standard_flags():
@@ -58,9 +65,225 @@ def test_invalid_standard_flag():
         BaseParser(description="Test parser", standard_flags=["invalid_flag"])
 
 
+def test_subclass_standard_flags():
+    """Test that subclasses can extend and redefine STANDARD_FLAGS."""
+
+    class CustomParser(BaseParser):
+        STANDARD_FLAGS = {
+            **BaseParser.STANDARD_FLAGS,
+            "verbose": {
+                "flags": ("-V", "--verbose"),
+                "action": "store_true",
+                "help": "Enable verbose output",
+            },
+            "force": {
+                "flags": ("-f", "--force"),
+                "action": "store_true",
+                "help": "Overwrite existing files",
+            },
+        }
+
+    parser = CustomParser(description="Test", standard_flags=["verbose", "force"])
+    args = parser.parse_args(["-V", "-f"])
+    assert args.verbose is True
+    assert args.force is True
+
+    # Extra standard flags are included by default
+    assert CustomParser(description="Test").get_standard_flags() == [
+        "recursive",
+        "dry-run",
+        "yes",
+        "verbose",
+        "force",
+    ]
+
+    # The base class keeps its own definitions
+    assert BaseParser(description="Test").parse_args(["-v"]).verbose is True
+    with pytest.raises(ValueError, match="Unknown standard flag"):
+        BaseParser(description="Test", standard_flags=["force"])
+
+
 def test_get_standard_flags():
     """Test retrieving list of standard flags."""
     parser = BaseParser(description="Test", standard_flags=["verbose", "dry-run"])
 
     flags = parser.get_standard_flags()
     assert flags == ["verbose", "dry-run"]
+
+
+def test_parse_known_args_large_argv_matches_argparse():
+    """Test that large argv lists parse the same as plain argparse."""
+    import argparse
+
+    parser = BaseParser(description="Test", standard_flags=["verbose"])
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--format")
+
+    reference = argparse.ArgumentParser(description="Test")
+    reference.add_argument("-v", "--verbose", action="store_true")
+    reference.add_argument("files", nargs="*")
+    reference.add_argument("--format")
+
+    argv = []
+    for i in range(300):
+        argv += [f"file{i}.txt", "-v", "--unknown", "value", "--format", "json"]
+
+    assert parser.parse_known_args(argv) == reference.parse_known_args(argv)
+
+    # Where argparse still has the quadratic scan, the patched loop is used
+    source = inspect.getsource(argparse.ArgumentParser._parse_known_args)
+    if _QUADRATIC_SCAN in source:
+        linear = _get_linear_parse_known_args()
+        assert linear is not None
+        assert linear.__code__.co_filename == "<cliparse argparse backport>"
+
+        calls = []
+
+        def tracking(*args, **kwargs):
+            calls.append(len(args[1]))
+            return linear(*args, **kwargs)
+
+        with mock.patch(
+            "cliparse.parser._get_linear_parse_known_args", return_value=tracking
+        ):
+            assert parser.parse_known_args(argv) == reference.parse_known_args(argv)
+        assert calls == [len(argv)]
+
+
+def test_fast_parse_matches_argparse():
+    """Test that the fast path gives the same namespace as argparse."""
+    import argparse
+
+    parser = BaseParser(description="Test")
+    parser.add_argument("files", nargs="+")
+
+    argv = ["a.txt", "b.txt", "-R", "--dry-run", "-v"]
+    assert parser._fast_parse(argv) is not None
+    assert parser.parse_args(argv) == argparse.ArgumentParser.parse_args(parser, argv)
+
+    # Options sharing a dest keep the first action's default
+    parser = BaseParser(description="Test")
+    parser.add_argument("--no-color", dest="color", action="store_false")
+    parser.add_argument("--color", dest="color", action="store_true")
+    parser.add_argument("files", nargs="+")
+
+    for argv in (["a"], ["a", "--color"], ["a", "--no-color"]):
+        assert parser._fast_parse(argv) is not None
+        assert parser.parse_args(argv) == argparse.ArgumentParser.parse_args(
+            parser, argv
+        )
+
+
+def test_fast_parse_runs_parse_known_args_override():
+    """Test that an overridden parse_known_args still runs."""
+
+    class HookedParser(BaseParser):
+        def parse_known_args(self, args=None, namespace=None):
+            namespace, extras = super().parse_known_args(args, namespace)
+            namespace.hooked = True
+            return namespace, extras
+
+    parser = HookedParser(description="Test")
+    parser.add_argument("files", nargs="+")
+
+    args = parser.parse_args(["a", "-v"])
+    assert args.verbose is True
+    assert args.hooked is True
+
+
+def test_fast_parse_skips_custom_flag_actions():
+    """Test that flag actions with their own __call__ still run."""
+    import argparse
+
+    class CountingTrue(argparse._StoreTrueAction):
+        def __call__(self, parser, namespace, values, option_string=None):
+            setattr(namespace, "seen", True)
+            super().__call__(parser, namespace, values, option_string)
+
+    parser = BaseParser(description="Test")
+    parser.add_argument("--flag", action=CountingTrue)
+
+    args = parser.parse_args(["--flag"])
+    assert args.flag is True
+    assert args.seen is True
+
+
+def test_fast_parse_falls_back_to_argparse():
+    """Test that unsupported argv still gets argparse handling."""
+    parser = BaseParser(description="Test")
+    parser.add_argument("files", nargs="+")
+
+    # Combined short flags are left to argparse
+    args = parser.parse_args(["a.txt", "-vR"])
+    assert args.verbose is True
+    assert args.recursive is True
+
+    # Errors still exit with the usage error code
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["a.txt", "--unknown"])
+    assert exc_info.value.code == 2
+
+
+def test_empty_argv_returns_fresh_defaults():
+    """Test that repeated empty parses don't share a namespace."""
+    parser = BaseParser(description="Test")
+    parser.add_argument("--custom", type=int, default="42")
+
+    first = parser.parse_args([])
+    first.verbose = True
+
+    second = parser.parse_args([])
+    assert second.verbose is False
+    assert second.custom == 42
+
+
+def test_empty_argv_converts_string_defaults_each_time():
+    """Test that type= runs on string defaults for every empty parse."""
+    calls = []
+
+    def level(value):
+        calls.append(value)
+        return int(value)
+
+    parser = BaseParser(description="Test")
+    parser.add_argument("--level", type=level, default="1")
+
+    assert parser.parse_args([]).level == 1
+    assert parser.parse_args([]).level == 1
+    assert calls == ["1", "1"]
+
+
+def test_empty_argv_runs_parse_known_args_override():
+    """Test that an overridden parse_known_args runs on every empty parse."""
+    calls = []
+
+    class HookedParser(BaseParser):
+        def parse_known_args(self, args=None, namespace=None):
+            calls.append(args)
+            return super().parse_known_args(args, namespace)
+
+    parser = HookedParser(description="Test")
+    parser.parse_args([])
+    parser.parse_args([])
+    assert len(calls) == 2
+
+
+def test_empty_argv_sees_changed_defaults():
+    """Test that default changes after a parse are not cached over."""
+    parser = BaseParser(description="Test", conflict_handler="resolve")
+    level = parser.add_argument("--level", default="1")
+    group = parser.add_argument_group("extra")
+    group.add_argument("--mode", default="fast")
+    assert parser.parse_args([]).level == "1"
+
+    level.default = "3"
+    assert parser.parse_args([]).level == "3"
+
+    group.set_defaults(mode="slow", extra=True)
+    args = parser.parse_args([])
+    assert args.mode == "slow"
+    assert args.extra is True
+
+    # Replacing an action keeps the action count unchanged
+    parser.add_argument("--level", default="9")
+    assert parser.parse_args([]).level == "9"
@@ -39,6 +39,8 @@ def test_register_script():
     assert script.description == "Test script"
     assert "-v" in script.supported_flags
     assert "--custom" in script.supported_flags
+    assert script.supported_flags_sorted == ("--custom", "-v")
+    assert script.supported_flags_str == "--custom, -v"
 
 
 def test_registry_list_all():
@@ -110,6 +112,53 @@ def test_coordinator_run_scripts():
     assert results.failed_count == 0
 
 
+def test_coordinator_run_parse_known():
+    """Test running scripts that drop unknown args via parse_known_args."""
+
+    # --format is defined by the parser but missing from supports, so only
+    # the parse_known path passes it through
+    @register_script(name="script-a", supports=["-v"])
+    def create_parser():
+        parser = BaseParser(description="Script A", standard_flags=["verbose"])
+        parser.add_argument("files", nargs="+")
+        parser.add_argument("--format", required=True)
+        return parser
+
+    coordinator = Coordinator()
+    args = ["file.txt", "-v", "--format", "json", "--unknown"]
+
+    results = coordinator.run(scripts=["script-a"], args=args, use_parse_known=True)
+    assert results.all_success
+
+    results = coordinator.run(scripts=["script-a"], args=args)
+    assert not results.all_success
+    assert "--format" in results.results[0].error_message
+
+
+def test_coordinator_run_threaded():
+    """Test running scripts on a thread pool keeps result order."""
+    for name in ("script-a", "script-b", "script-c"):
+        register_script(name=name, supports=["-v"])(
+            lambda: BaseParser(description="Threaded", standard_flags=["verbose"])
+        )
+
+    coordinator = Coordinator()
+
+    results = coordinator.run(
+        scripts=["script-c", "missing", "script-a", "script-b"],
+        args=["-v"],
+        max_workers=2,
+    )
+
+    assert [r.script_name for r in results.results] == [
+        "script-c",
+        "missing",
+        "script-a",
+        "script-b",
+    ]
+    assert results.failed_count == 1
+
+
 def test_batch_results_summary():
     """Test batch results summary generation."""
     results = BatchResults()
@@ -136,3 +185,169 @@ def test_coordinator_unknown_script():
     assert not results.all_success
     assert results.failed_count == 1
     assert "not found" in results.results[0].error_message
+
+
+def test_coordinator_load_scripts_from_directory(tmp_path, capsys):
+    """Test loading scripts from a directory of Python files."""
+    import sys
+
+    (tmp_path / "cliparse_test_helper.py").write_text("DESCRIPTION = 'Loaded'\n")
+    (tmp_path / "cliparse_test_loadedReplacer.py").write_text(
+        "from cliparse_test_helper import DESCRIPTION\n"
+        "from cliparse.registry import register_script\n"
+        "\n"
+        "@register_script(name='loaded', description=DESCRIPTION)\n"
+        "def create_parser():\n"
+        "    pass\n"
+    )
+    (tmp_path / "_cliparse_test_privateReplacer.py").write_text(
+        "raise RuntimeError('should be skipped')\n"
+    )
+    (tmp_path / "cliparse_test_brokenReplacer.py").write_text(
+        "raise RuntimeError('broken script')\n"
+    )
+    sys_path = list(sys.path)
+
+    coordinator = Coordinator()
+    try:
+        coordinator.load_scripts_from_directory(str(tmp_path))
+    finally:
+        for name in ("cliparse_test_helper", "cliparse_test_loadedReplacer"):
+            sys.modules.pop(name, None)
+
+    assert coordinator.list_scripts() == ["loaded"]
+    assert coordinator.get_script_info("loaded").description == "Loaded"
+    assert "broken script" in capsys.readouterr().err
+    assert "cliparse_test_brokenReplacer" not in sys.modules
+    assert sys.path == sys_path
+
+
+def test_coordinator_run_empty_args():
+    """Test running scripts with no arguments."""
+
+    @register_script(name="no-args", supports=["-v"])
+    def create_parser_a():
+        return BaseParser(description="No args")
+
+    @register_script(name="needs-files", supports=["-v"])
+    def create_parser_b():
+        parser = BaseParser(description="Needs files")
+        parser.add_argument("files", nargs="+")
+        return parser
+
+    coordinator = Coordinator()
+
+    results = coordinator.run(scripts=["no-args", "needs-files", "missing"], args=[])
+
+    assert [r.success for r in results.results] == [True, False, False]
+    assert results.results[1].exit_code == 2
+    assert "arguments are required: files" in results.results[1].error_message
+    assert "not found" in results.results[2].error_message
+
+
+def test_register_script_description_defaults():
+    """Test description fallbacks when none is given."""
+    calls = []
+
+    @register_script(name="documented")
+    def create_parser_a():
+        """Documented script.
+
+        More details.
+        """
+        calls.append("documented")
+        return BaseParser(description="Parser description")
+
+    @register_script(name="undocumented")
+    def create_parser_b():
+        calls.append("undocumented")
+        return BaseParser(description="Parser description")
+
+    assert ScriptRegistry.get("documented").description == "Documented script."
+    assert ScriptRegistry.get("undocumented").description == "Parser description"
+    assert calls == ["undocumented"]
+
+
+def test_coordinator_run_keeps_parser_error_override():
+    """Test a factory's own parser.error survives a batch run."""
+    parser = BaseParser(description="Custom error", standard_flags=["verbose"])
+    parser.add_argument("files", nargs="+")
+
+    def custom_error(message):
+        raise RuntimeError(message)
+
+    parser.error = custom_error
+    register_script(name="custom", supports=["-v"])(lambda: parser)
+
+    coordinator = Coordinator()
+
+    results = coordinator.run(scripts=["custom"], args=["-v"])
+
+    assert results.results[0].exit_code == 2
+    assert "arguments are required: files" in results.results[0].error_message
+    assert parser.error is custom_error
+
+
+def test_coordinator_filter_cache_keeps_latest_args():
+    """Test that repeated runs with new args don't grow the filter cache."""
+    register_script(name="script-a", supports=["-v"])(
+        lambda: BaseParser(description="Cached", standard_flags=["verbose"])
+    )
+
+    coordinator = Coordinator()
+
+    for i in range(5):
+        results = coordinator.run(scripts=["script-a"], args=["-v", f"--x={i}"])
+        assert results.success_count == 1
+
+    assert list(coordinator._filter_cache) == ["script-a"]
+    assert coordinator._filter_cache["script-a"][1] == ["-v"]
+
+
+def test_coordinator_run_threaded_shared_parser():
+    """Test threaded runs of scripts that share one parser instance."""
+    import time
+
+    class SlowParser(BaseParser):
+        def parse_args(self, args=None, namespace=None):
+            time.sleep(0.001)
+            return super().parse_args(args, namespace)
+
+    parser = SlowParser(description="Shared", standard_flags=["verbose"])
+    parser.add_argument("files", nargs="*")
+    names = [f"script-{i}" for i in range(8)]
+    for name in names:
+        register_script(name=name, supports=["-v"])(lambda: parser)
+
+    coordinator = Coordinator()
+
+    for _ in range(5):
+        results = coordinator.run(
+            scripts=names, args=["-v", "a.txt", "--bad"], max_workers=4
+        )
+        assert results.success_count == len(names)
+        assert [r.error_message for r in results.results] == [None] * len(names)
+
+    assert "error" not in vars(parser)
+
+
+def test_coordinator_run_duck_typed_parser():
+    """Test that parser-like objects without a __dict__ still run."""
+
+    class SlotParser:
+        __slots__ = ()
+
+        def parse_args(self, args):
+            if "--bad" in args:
+                raise SystemExit(2)
+            return args
+
+    register_script(name="slotted", description="Slotted", supports=["-v", "--bad"])(
+        SlotParser
+    )
+
+    coordinator = Coordinator()
+
+    assert coordinator.run(scripts=["slotted"], args=["-v"]).success_count == 1
+    results = coordinator.run(scripts=["slotted"], args=["--bad"])
+    assert results.results[0].exit_code == 2